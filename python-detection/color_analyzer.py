@@ -6,10 +6,18 @@ Extracts dominant colors and determines if they're problematic for specific colo
 from enum import Enum
 from typing import Optional
 import logging
+import math
+import threading
 
 import cv2
 import numpy as np
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,13 +36,12 @@ class ColorBlindnessType(Enum):
 
 # HSV color ranges for detection
 # Format: (H_min, S_min, V_min), (H_max, S_max, V_max)
+# A hue range with H_min > H_max wraps around 180 (used for reds)
 # Expanded with more nuanced colors for better descriptions
 COLOR_RANGES = {
     # Reds
-    "red_low": ((0, 100, 100), (10, 255, 255)),
-    "red_high": ((160, 100, 100), (180, 255, 255)),
-    "dark_red": ((0, 100, 50), (10, 255, 100)),        # Maroon, burgundy
-    "dark_red_high": ((160, 100, 50), (180, 255, 100)),
+    "red": ((160, 100, 100), (10, 255, 255)),
+    "dark_red": ((160, 100, 50), (10, 255, 100)),      # Maroon, burgundy
 
     # Oranges and browns
     "orange": ((10, 100, 100), (20, 255, 255)),
@@ -78,48 +85,46 @@ COLOR_RANGES = {
     "black": ((0, 0, 0), (180, 255, 50)),
 }
 
-# Which colors are problematic for each colorblindness type
+# Which colors are problematic for each colorblindness type (source for PROBLEMATIC_MASKS below)
 PROBLEMATIC_COLORS = {
-    ColorBlindnessType.NORMAL: [],
-    ColorBlindnessType.PROTANOPIA: [
-        "red_low", "red_high", "dark_red", "dark_red_high",
+    ColorBlindnessType.NORMAL: frozenset(),
+    ColorBlindnessType.PROTANOPIA: frozenset({
+        "red", "dark_red",
         "orange", "rust_orange", "brown", "dark_brown",
         "green", "dark_green", "olive", "lime"
-    ],
-    ColorBlindnessType.PROTANOMALY: [
-        "red_low", "red_high", "dark_red", "dark_red_high",
+    }),
+    ColorBlindnessType.PROTANOMALY: frozenset({
+        "red", "dark_red",
         "orange", "rust_orange", "brown"
-    ],
-    ColorBlindnessType.DEUTERANOPIA: [
-        "red_low", "red_high", "dark_red", "dark_red_high",
+    }),
+    ColorBlindnessType.DEUTERANOPIA: frozenset({
+        "red", "dark_red",
         "green", "dark_green", "lime", "olive",
         "yellow", "gold", "brown"
-    ],
-    ColorBlindnessType.DEUTERANOMALY: [
+    }),
+    ColorBlindnessType.DEUTERANOMALY: frozenset({
         "green", "dark_green", "lime", "olive",
         "yellow", "gold"
-    ],
-    ColorBlindnessType.TRITANOPIA: [
+    }),
+    ColorBlindnessType.TRITANOPIA: frozenset({
         "blue", "light_blue", "dark_blue",
         "yellow", "gold", "pale_yellow",
         "cyan", "teal",
         "violet", "purple"
-    ],
-    ColorBlindnessType.TRITANOMALY: [
+    }),
+    ColorBlindnessType.TRITANOMALY: frozenset({
         "blue", "light_blue",
         "yellow", "gold"
-    ],
-    ColorBlindnessType.ACHROMATOPSIA: list(COLOR_RANGES.keys()),  # All colors problematic
-    ColorBlindnessType.LOW_VISION: [],  # Low vision users prioritize by size, not color
+    }),
+    ColorBlindnessType.ACHROMATOPSIA: frozenset(COLOR_RANGES),  # All colors problematic
+    ColorBlindnessType.LOW_VISION: frozenset(),  # Low vision users prioritize by size, not color
 }
 
 # Human-readable color names with more descriptive labels
 COLOR_DISPLAY_NAMES = {
     # Reds
-    "red_low": "red",
-    "red_high": "red",
+    "red": "red",
     "dark_red": "dark red (maroon)",
-    "dark_red_high": "dark red (burgundy)",
 
     # Oranges and browns
     "orange": "orange",
@@ -163,183 +168,458 @@ COLOR_DISPLAY_NAMES = {
     "black": "black",
 }
 
+# Canonical color ordering; color percentages are arrays indexed like this tuple
+COLOR_NAMES = tuple(COLOR_RANGES.keys())
 
-class ColorAnalyzer:
-    """Analyzes colors in image regions for colorblind assistance"""
+
+def _bound_array(bound, channel):
+    """Contiguous uint8 array of one channel bound across all colors"""
+    return np.fromiter(
+        (ranges[bound][channel] for ranges in COLOR_RANGES.values()),
+        dtype=np.uint8,
+        count=len(COLOR_RANGES)
+    )
+
+
+# COLOR_RANGES as flat per-channel bound arrays, indexed like COLOR_NAMES
+H_LO, S_LO, V_LO = (_bound_array(0, channel) for channel in range(3))
+H_HI, S_HI, V_HI = (_bound_array(1, channel) for channel in range(3))
+
+# Display names parallel to COLOR_NAMES
+COLOR_LABELS = tuple(COLOR_DISPLAY_NAMES.get(color_name, color_name) for color_name in COLOR_NAMES)
+
+# Problematic colors per colorblindness type as boolean masks over COLOR_NAMES
+PROBLEMATIC_MASKS = {
+    cb_type: np.isin(COLOR_NAMES, list(colors))
+    for cb_type, colors in PROBLEMATIC_COLORS.items()
+}
+_NO_PROBLEMATIC = np.zeros(len(COLOR_NAMES), dtype=bool)
+
+# Traffic light states and the indices of their colors
+_TRAFFIC_LIGHT_STATES = ("red", "yellow", "green")
+_TRAFFIC_LIGHT_COLORS = np.array([COLOR_NAMES.index(state) for state in _TRAFFIC_LIGHT_STATES])
+
+
+def _in_range(values, lower, upper):
+    """Membership of values in [lower, upper]; a range with lower > upper wraps around"""
+    if lower <= upper:
+        return (lower <= values) & (values <= upper)
+    return (lower <= values) | (values <= upper)
+
+
+_LEVELS = np.arange(256)
+
+
+def _channel_bins(lows, highs):
+    """
+    Split a channel's 0-255 values into bins at every color range boundary
     
-    def __init__(self):
-        pass
+    Returns:
+        Tuple of (bin index per channel value, (n_bins, n_colors) membership)
+    """
+    edges = np.unique(np.concatenate(([0], lows, highs.astype(np.intp) + 1)))
+    edges = edges[edges < 256]
+    bin_of = np.searchsorted(edges, _LEVELS, side="right") - 1
     
-    def detect_colors(self, roi: np.ndarray) -> dict[str, float]:
-        """
-        Detect color presence in region of interest
-        
-        Args:
-            roi: BGR image region
-            
-        Returns:
-            Dictionary mapping color names to their percentage presence
-        """
-        if roi.size == 0:
-            return {}
-        
-        # Convert to HSV
-        hsv = cv2.cvtColor(roi, cv2.COLOR_BGR2HSV)
-        total_pixels = roi.shape[0] * roi.shape[1]
-        
-        color_percentages = {}
-        
-        for color_name, (lower, upper) in COLOR_RANGES.items():
-            lower = np.array(lower, dtype=np.uint8)
-            upper = np.array(upper, dtype=np.uint8)
-            
-            # Create mask for this color
-            mask = cv2.inRange(hsv, lower, upper)
-            
-            # Calculate percentage
-            color_pixels = cv2.countNonZero(mask)
-            percentage = (color_pixels / total_pixels) * 100
-            
-            if percentage > 5:  # Only include if more than 5%
-                color_percentages[color_name] = round(percentage, 1)
+    # Membership is constant inside a bin, so its first value stands for all of it
+    members = np.stack([_in_range(edges, lo, hi) for lo, hi in zip(lows, highs)], axis=1)
+    return bin_of, members
+
+
+_H_BINS, _H_MEMBERS = _channel_bins(H_LO, H_HI)
+_S_BINS, _S_MEMBERS = _channel_bins(S_LO, S_HI)
+_V_BINS, _V_MEMBERS = _channel_bins(V_LO, V_HI)
+
+# Per-channel offsets into the flattened (H bin, S bin, V bin) cell grid; a
+# pixel's cell is _H_OFFSET[h] + _S_OFFSET[s] + _V_OFFSET[v]
+_H_OFFSET = (_H_BINS * (len(_S_MEMBERS) * len(_V_MEMBERS))).astype(np.int32)
+_S_OFFSET = (_S_BINS * len(_V_MEMBERS)).astype(np.int32)
+_V_OFFSET = _V_BINS.astype(np.int32)
+
+
+def _build_hsv_lut():
+    """
+    Build the HSV cell lookup table
+    
+    Cells with identical membership across all colors share a class, so per-color
+    counts follow from a histogram of classes.
+    
+    Returns:
+        Tuple of (class per cell, (n_classes, n_colors) class membership)
+    """
+    cells = (
+        _H_MEMBERS[:, None, None, :]
+        & _S_MEMBERS[None, :, None, :]
+        & _V_MEMBERS[None, None, :, :]
+    ).reshape(-1, len(COLOR_NAMES))
+    class_members, cell_class = np.unique(cells, axis=0, return_inverse=True)
+    class_dtype = np.uint8 if len(class_members) <= 256 else np.uint16
+    return cell_class.reshape(-1).astype(class_dtype), class_members.astype(np.int64)
+
+
+_HSV_CELL_CLASS, _CLASS_MEMBERS = _build_hsv_lut()
+
+# Class membership restricted to the traffic light colors
+_TRAFFIC_LIGHT_MEMBERS = _CLASS_MEMBERS[:, _TRAFFIC_LIGHT_COLORS]
+
+
+def _build_bgr_lut():
+    """
+    Build the class of every 24-bit BGR color, indexed by (b << 16) | (g << 8) | r
+    
+    Each color is converted to HSV once here, so classification at runtime
+    needs neither cvtColor nor the HSV tables.
+    """
+    bgr_class = np.empty(1 << 24, dtype=_HSV_CELL_CLASS.dtype)
+    green, red = np.meshgrid(_LEVELS.astype(np.uint8), _LEVELS.astype(np.uint8), indexing="ij")
+    plane = np.empty((256 * 256, 1, 3), dtype=np.uint8)
+    plane[:, 0, 1] = green.ravel()
+    plane[:, 0, 2] = red.ravel()
+    
+    # Convert one blue plane at a time to bound the temporary memory
+    for blue in range(256):
+        plane[:, 0, 0] = blue
+        hsv = cv2.cvtColor(plane, cv2.COLOR_BGR2HSV).reshape(-1, 3)
+        cells = _H_OFFSET[hsv[:, 0]] + _S_OFFSET[hsv[:, 1]] + _V_OFFSET[hsv[:, 2]]
+        bgr_class[blue << 16:(blue + 1) << 16] = _HSV_CELL_CLASS[cells]
+    return bgr_class
+
+
+# Class per BGR color (16 MB); one lookup classifies a pixel against all colors
+_BGR_CLASS = _build_bgr_lut()
+
+# Regions larger than this are downsampled before classification; color
+# percentages converge well before every pixel is visited
+MAX_ANALYSIS_PIXELS = 4096
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, parallel=True)
+    def _classify(bgr_flat, region_bounds, bgr_class, class_counts):
+        """Accumulate per-class pixel counts for each region of an (N, 3) BGR array into class_counts"""
+        # Regions run in parallel; each only writes its own row of class_counts
+        for region in prange(len(region_bounds) - 1):
+            for i in range(region_bounds[region], region_bounds[region + 1]):
+                color = (np.int32(bgr_flat[i, 0]) << 16) | (np.int32(bgr_flat[i, 1]) << 8) | np.int32(bgr_flat[i, 2])
+                class_counts[region, bgr_class[color]] += 1
+
+
+# Per-thread scratch buffers reused across calls
+_scratch = threading.local()
+
+
+def _buffer(name: str, n_pixels: int, n_channels: int) -> np.ndarray:
+    """Return this thread's (n_pixels, n_channels) uint8 scratch buffer, growing it if needed"""
+    buf = getattr(_scratch, name, None)
+    if buf is None or buf.shape[0] < n_pixels or buf.shape[1] != n_channels:
+        buf = np.empty((n_pixels, n_channels), dtype=np.uint8)
+        setattr(_scratch, name, buf)
+    return buf[:n_pixels]
+
+
+def detect_colors(roi: np.ndarray) -> np.ndarray:
+    """
+    Detect color presence in region of interest
+    
+    Args:
+        roi: BGR image region
         
-        return color_percentages
+    Returns:
+        Array of percentage presence per color, indexed like COLOR_NAMES
+    """
+    return detect_colors_batch([roi])[0]
+
+
+def detect_colors_batch(rois: list[np.ndarray]) -> np.ndarray:
+    """
+    Detect color presence in several regions with one conversion and classification pass
     
-    def get_dominant_colors(self, roi: np.ndarray, top_n: int = 3) -> list[str]:
-        """
-        Get the top N dominant colors in a region
+    Args:
+        rois: BGR image regions
         
-        Args:
-            roi: BGR image region
-            top_n: Number of colors to return
-            
-        Returns:
-            List of dominant color names
-        """
-        color_percentages = self.detect_colors(roi)
+    Returns:
+        (len(rois), n_colors) float32 array of percentage presence, columns indexed like COLOR_NAMES
+    """
+    bgr, region_bounds = _stack_regions(rois)
+    counts = _count_colors(bgr, region_bounds, _CLASS_MEMBERS)
+    
+    # Empty regions have no pixels and keep all-zero percentages
+    region_pixels = np.diff(region_bounds)[:, None]
+    percentages = np.divide(counts * 100.0, region_pixels, out=np.zeros(counts.shape), where=region_pixels > 0)
+    
+    # Divide in float64 so exact 5% / 10% shares land exactly on the thresholds;
+    # narrowing afterwards is monotonic and keeps them there
+    return percentages.astype(np.float32)
+
+
+def _downsample(roi: np.ndarray) -> np.ndarray:
+    """Shrink a region to at most about MAX_ANALYSIS_PIXELS pixels"""
+    total_pixels = roi.shape[0] * roi.shape[1]
+    
+    # INTER_NEAREST samples original pixels rather than blending neighbours into
+    # colors that are not in the region, so color fractions stay unbiased
+    scale = math.sqrt(MAX_ANALYSIS_PIXELS / total_pixels) if total_pixels else 1
+    if scale < 1:
+        size = (max(1, round(roi.shape[1] * scale)), max(1, round(roi.shape[0] * scale)))
+        roi = cv2.resize(roi, size, interpolation=cv2.INTER_NEAREST)
+    return roi
+
+
+def _stack_regions(rois: list[np.ndarray]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Downsample regions if needed and stack their pixels into one stream
+    
+    Args:
+        rois: BGR image regions
         
-        # Sort by percentage
-        sorted_colors = sorted(
-            color_percentages.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )
+    Returns:
+        Tuple of ((N, 3) BGR pixel array backed by a reused per-thread buffer,
+        (len(rois) + 1,) offsets where each region's pixels start and end)
+    """
+    pixels = [_downsample(roi).reshape(-1, 3) for roi in rois]
+    region_bounds = np.zeros(len(pixels) + 1, dtype=np.int64)
+    np.cumsum([len(region) for region in pixels], out=region_bounds[1:])
+    
+    bgr = _buffer("bgr", int(region_bounds[-1]), 3)
+    if pixels:
+        np.concatenate(pixels, out=bgr)
+    return bgr, region_bounds
+
+
+def _count_colors(bgr: np.ndarray, region_bounds: np.ndarray, class_members: np.ndarray) -> np.ndarray:
+    """
+    Count the pixels of each region falling in each of a set of colors
+    
+    Args:
+        bgr: (N, 3) BGR pixel array
+        region_bounds: Offsets where each region's pixels start and end
+        class_members: (n_classes, n_colors) membership of each lookup class
         
-        # Get unique display names
-        seen = set()
-        dominant = []
-        for color_name, _ in sorted_colors:
-            display_name = COLOR_DISPLAY_NAMES.get(color_name, color_name)
-            if display_name not in seen:
-                seen.add(display_name)
-                dominant.append(display_name)
-            if len(dominant) >= top_n:
-                break
+    Returns:
+        (n_regions, n_colors) pixel counts
+    """
+    n_regions = len(region_bounds) - 1
+    
+    # Classify every pixel with one table lookup and histogram the classes per region
+    if NUMBA_AVAILABLE:
+        class_counts = np.zeros((n_regions, len(class_members)), dtype=np.int64)
+        _classify(bgr, region_bounds, _BGR_CLASS, class_counts)
+    else:
+        colors = bgr[:, 0].astype(np.int32) << 16
+        colors |= bgr[:, 1].astype(np.int32) << 8
+        colors |= bgr[:, 2]
+        classes = _BGR_CLASS[colors].reshape(-1, 1)
         
-        return dominant
-    
-    def is_problematic_for_user(
-        self, 
-        detected_colors: dict[str, float], 
-        colorblindness_type: ColorBlindnessType
-    ) -> tuple[bool, Optional[str]]:
-        """
-        Check if detected colors are problematic for user's colorblindness type
+        # One calcHist pass over each region's slice of the class stream
+        class_counts = np.zeros((n_regions, len(class_members)), dtype=np.int64)
+        for region in range(n_regions):
+            start, end = region_bounds[region], region_bounds[region + 1]
+            if end > start:
+                hist = cv2.calcHist([classes[start:end]], [0], None, [len(class_members)], [0, len(class_members)])
+                class_counts[region] = hist.ravel()
+    
+    return class_counts @ class_members
+
+
+def color_breakdown(color_percentages: np.ndarray) -> dict[str, float]:
+    """
+    Convert color percentages into a name-keyed dictionary of present colors
+    
+    Args:
+        color_percentages: Percentages indexed like COLOR_NAMES
         
-        Args:
-            detected_colors: Dictionary of color names and percentages
-            colorblindness_type: User's colorblindness type
-            
-        Returns:
-            Tuple of (is_problematic, warning_message)
-        """
-        problematic = PROBLEMATIC_COLORS.get(colorblindness_type, [])
+    Returns:
+        Dictionary mapping color names to their percentage presence
+    """
+    # Only include colors covering more than 5% of the region
+    present = np.flatnonzero(color_percentages > 5)
+    
+    # Round only the reported entries; widening first keeps values like 22.4 free of float32 noise
+    values = color_percentages[present].astype(np.float64)
+    np.round(values, 1, out=values)
+    return dict(zip([COLOR_NAMES[i] for i in present], values.tolist()))
+
+
+def get_dominant_colors(roi: np.ndarray, top_n: int = 3) -> list[str]:
+    """
+    Get the top N dominant colors in a region
+    
+    Args:
+        roi: BGR image region
+        top_n: Number of colors to return
         
-        if not problematic:
-            return False, None
+    Returns:
+        List of dominant color names
+    """
+    return _dominant_from_percentages(detect_colors(roi), top_n)
+
+
+def _dominant_from_percentages(color_percentages: np.ndarray, top_n: int = 3) -> list[str]:
+    """
+    Get the top N dominant colors from already-computed percentages
+    
+    Args:
+        color_percentages: Percentages indexed like COLOR_NAMES
+        top_n: Number of colors to return
         
-        # Check if any significant colors are problematic
-        found_problematic = []
-        for color_name, percentage in detected_colors.items():
-            if color_name in problematic and percentage > 10:
-                display_name = COLOR_DISPLAY_NAMES.get(color_name, color_name)
-                found_problematic.append((display_name, percentage))
+    Returns:
+        List of dominant color names
+    """
+    # Only colors covering more than 5% of the region are candidates
+    candidates = np.flatnonzero(color_percentages > 5)
+    if candidates.size == 0 or top_n <= 0:
+        return []
+    
+    vals = color_percentages[candidates]
+    
+    # Partially select the largest percentages, oversampling so that colors
+    # sharing a display name still leave top_n unique names
+    n_candidates = min(top_n * 2, len(vals))
+    idx = np.argpartition(-vals, n_candidates - 1)[:n_candidates]
+    
+    # Sort only the candidates, breaking ties by color order
+    idx = idx[np.lexsort((idx, -vals[idx]))]
+    
+    # Get unique display names
+    seen = set()
+    dominant = []
+    for i in candidates[idx]:
+        display_name = COLOR_LABELS[i]
+        if display_name not in seen:
+            seen.add(display_name)
+            dominant.append(display_name)
+        if len(dominant) >= top_n:
+            break
+    
+    return dominant
+
+
+def is_problematic_for_user(
+    color_percentages: np.ndarray, 
+    colorblindness_type: ColorBlindnessType
+) -> tuple[bool, Optional[str]]:
+    """
+    Check if detected colors are problematic for user's colorblindness type
+    
+    Args:
+        color_percentages: Percentages indexed like COLOR_NAMES
+        colorblindness_type: User's colorblindness type
         
-        if found_problematic:
-            # Generate warning message
-            colors_str = ", ".join([c[0] for c in found_problematic[:2]])
-            warning = f"Contains {colors_str} - may be difficult to see"
-            return True, warning
+    Returns:
+        Tuple of (is_problematic, warning_message)
+    """
+    problematic = PROBLEMATIC_MASKS.get(colorblindness_type, _NO_PROBLEMATIC)
+    
+    # Significant colors that are problematic
+    found_problematic = np.flatnonzero((color_percentages > 10) & problematic)
+    
+    if found_problematic.size:
+        # Generate warning message
+        colors_str = ", ".join([COLOR_LABELS[i] for i in found_problematic[:2]])
+        warning = f"Contains {colors_str} - may be difficult to see"
+        return True, warning
+    
+    return False, None
+
+
+def analyze_region(
+    roi: np.ndarray, 
+    colorblindness_type: ColorBlindnessType
+) -> dict:
+    """
+    Full color analysis of a region for colorblind assistance
+    
+    Args:
+        roi: BGR image region
+        colorblindness_type: User's colorblindness type
         
-        return False, None
-    
-    def analyze_region(
-        self, 
-        roi: np.ndarray, 
-        colorblindness_type: ColorBlindnessType
-    ) -> dict:
-        """
-        Full color analysis of a region for colorblind assistance
+    Returns:
+        Dictionary with analysis results
+    """
+    return analyze_regions([roi], colorblindness_type)[0]
+
+
+def analyze_regions(
+    rois: list[np.ndarray],
+    colorblindness_type: ColorBlindnessType
+) -> list[dict]:
+    """
+    Full color analysis of several regions, classified in one batch
+    
+    Args:
+        rois: BGR image regions
+        colorblindness_type: User's colorblindness type
         
-        Args:
-            roi: BGR image region
-            colorblindness_type: User's colorblindness type
-            
-        Returns:
-            Dictionary with analysis results
-        """
+    Returns:
+        List of analysis results, one per region, as returned by analyze_region
+    """
+    # Detect all colors in every region at once
+    batch_colors = detect_colors_batch(rois)
+    
+    results = []
+    for roi, detected_colors in zip(rois, batch_colors):
         if roi.size == 0:
-            return {
+            results.append({
                 "dominant_colors": [],
                 "is_problematic": False,
                 "warning": None
-            }
-        
-        # Detect all colors
-        detected_colors = self.detect_colors(roi)
+            })
+            continue
         
         # Get dominant colors
-        dominant = self.get_dominant_colors(roi)
+        dominant = _dominant_from_percentages(detected_colors)
         
         # Check if problematic
-        is_problematic, warning = self.is_problematic_for_user(
+        is_problematic, warning = is_problematic_for_user(
             detected_colors, 
             colorblindness_type
         )
         
-        return {
+        results.append({
             "dominant_colors": dominant,
             "is_problematic": is_problematic,
             "warning": warning,
-            "color_breakdown": detected_colors
-        }
+            "color_breakdown": color_breakdown(detected_colors)
+        })
     
-    def analyze_traffic_light(self, roi: np.ndarray) -> dict:
-        """
-        Specialized analysis for traffic lights
-        
-        Args:
-            roi: BGR image region containing traffic light
-            
-        Returns:
-            Dictionary with traffic light state
-        """
-        if roi.size == 0:
-            return {"state": "unknown", "confidence": 0}
-        
-        colors = self.detect_colors(roi)
-        
-        # Check for each traffic light color
-        red_pct = colors.get("red_low", 0) + colors.get("red_high", 0)
-        yellow_pct = colors.get("yellow", 0)
-        green_pct = colors.get("green", 0)
+    return results
+
+
+def analyze_traffic_light(roi: np.ndarray) -> dict:
+    """
+    Specialized analysis for traffic lights
+    
+    Args:
+        roi: BGR image region containing traffic light
         
-        # Determine state
-        if red_pct > yellow_pct and red_pct > green_pct and red_pct > 10:
-            return {"state": "red", "confidence": min(red_pct / 100, 1.0)}
-        elif yellow_pct > red_pct and yellow_pct > green_pct and yellow_pct > 10:
-            return {"state": "yellow", "confidence": min(yellow_pct / 100, 1.0)}
-        elif green_pct > red_pct and green_pct > yellow_pct and green_pct > 10:
-            return {"state": "green", "confidence": min(green_pct / 100, 1.0)}
-        else:
-            return {"state": "unknown", "confidence": 0}
+    Returns:
+        Dictionary with traffic light state
+    """
+    if roi.size == 0:
+        return {"state": "unknown", "confidence": 0}
+    
+    # Classify only the traffic light colors
+    bgr, region_bounds = _stack_regions([roi])
+    counts = _count_colors(bgr, region_bounds, _TRAFFIC_LIGHT_MEMBERS)[0]
+    light_pcts = counts * 100.0 / len(bgr)
+    
+    # Pick the strongest traffic light color
+    strongest = int(light_pcts.argmax())
+    pct = float(light_pcts[strongest])
+    
+    # A tie for strongest (e.g. hue 35 counts as both yellow and green) stays unknown
+    if pct <= 10 or np.count_nonzero(light_pcts == pct) > 1:
+        return {"state": "unknown", "confidence": 0}
+    return {"state": _TRAFFIC_LIGHT_STATES[strongest], "confidence": float(counts[strongest] / len(bgr))}
+
+
+class ColorAnalyzer:
+    """Analyzes colors in image regions for colorblind assistance (facade over the module functions)"""
+    
+    detect_colors = staticmethod(detect_colors)
+    detect_colors_batch = staticmethod(detect_colors_batch)
+    color_breakdown = staticmethod(color_breakdown)
+    get_dominant_colors = staticmethod(get_dominant_colors)
+    is_problematic_for_user = staticmethod(is_problematic_for_user)
+    analyze_region = staticmethod(analyze_region)
+    analyze_regions = staticmethod(analyze_regions)
+    analyze_traffic_light = staticmethod(analyze_traffic_light)
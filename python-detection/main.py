@@ -294,9 +294,8 @@ async def detect_objects(request: DetectionRequest):
             detections = detections[:mode_config["max_objects"]]
             logger.info(f"Limited to {mode_config['max_objects']} objects for {transport_mode} mode")
         
-        # Analyze colors and filter for colorblind relevance
-        detected_objects = []
-        critical_alerts = []
+        # Collect regions of interest for color analysis
+        regions = []
         
         for det in detections:
             x, y, w, h = det["bbox"]
@@ -313,11 +312,16 @@ async def detect_objects(request: DetectionRequest):
                 continue
             
             # Extract region of interest for color analysis
-            roi = frame[y:y+h, x:x+w]
-            
-            # Analyze colors in the detected region
-            color_info = color_analyzer.analyze_region(roi, cb_type)
-            
+            regions.append((det, x, y, w, h, frame[y:y+h, x:x+w]))
+        
+        # Analyze colors in all detected regions in one batch
+        color_infos = color_analyzer.analyze_regions([roi for *_, roi in regions], cb_type)
+        
+        # Filter for colorblind relevance
+        detected_objects = []
+        critical_alerts = []
+        
+        for (det, x, y, w, h, _), color_info in zip(regions, color_infos):
             # Determine priority based on object type, color, and for low_vision: size/proximity
             bbox_area = w * h
             frame_area = frame_width * frame_height